@@ -1,9 +1,207 @@
+import http.client
+import importlib.util
+import json
 import os
+import urllib.request
+import warnings
 from datetime import date
+from functools import lru_cache
+from pathlib import Path
 import re
-import html
+import numpy as np
 import pandas as pd
 
+# Échappement HTML en une seule passe (mêmes entités que html.escape)
+_HTML_TRANS = str.maketrans({"&": "&amp;", "<": "&lt;", ">": "&gt;", '"': "&quot;", "'": "&#x27;"})
+_ESPACES = re.compile(r"\s+")
+
+# Fichiers jQuery / DataTables : nom local (dossier `_assets/`) et URL du CDN
+_ASSETS = {
+    "jquery_js": ("jquery.min.js", "https://code.jquery.com/jquery-3.6.0.min.js"),
+    "datatables_css": ("jquery.dataTables.min.css", "https://cdn.datatables.net/1.13.4/css/jquery.dataTables.min.css"),
+    "datatables_js": ("jquery.dataTables.min.js", "https://cdn.datatables.net/1.13.4/js/jquery.dataTables.min.js"),
+    "rowgroup_css": ("rowGroup.dataTables.min.css", "https://cdn.datatables.net/rowgroup/1.3.1/css/rowGroup.dataTables.min.css"),
+    "rowgroup_js": ("dataTables.rowGroup.min.js", "https://cdn.datatables.net/rowgroup/1.3.1/js/dataTables.rowGroup.min.js"),
+    "langue": ("fr-FR.json", "https://cdn.datatables.net/plug-ins/1.13.4/i18n/fr-FR.json"),
+}
+
+# Moteur Excel : calamine (Rust) si python-calamine est installé et géré par pandas (>= 2.2),
+# sinon None => pandas choisit le moteur selon l'extension (.xlsx/.xlsm, .xls, .ods)
+_MOTEUR_EXCEL = (
+    "calamine"
+    if importlib.util.find_spec("python_calamine") is not None
+    and tuple(int(x) for x in re.findall(r"\d+", pd.__version__)[:2]) >= (2, 2)
+    else None
+)
+
+# Délai (secondes) des téléchargements de `_ASSETS`
+_DELAI_TELECHARGEMENT = 10
+
+# Gabarits statiques de la page, construits une seule fois à l'import
+_GABARIT_ENTETE = """<!DOCTYPE html>
+<html lang="fr">
+<head>
+<meta charset="utf-8">
+<title>Suivi des actions – {today}</title>
+<link rel="stylesheet" href="{datatables_css}"/>
+<link rel="stylesheet" href="{rowgroup_css}"/>
+<script src="{jquery_js}"></script>
+<script defer src="{datatables_js}"></script>
+<script defer src="{rowgroup_js}"></script>
+<style>
+  body {{ font-family: Arial, sans-serif; margin:20px; }}
+  h1, h2 {{ font-family: Arial, sans-serif; }}
+  .toc ul {{
+    display: flex; flex-wrap: wrap; gap: 8px;
+    padding: 0; margin: 0 0 30px 0;
+  }}
+  .toc li {{ list-style: none; }}
+  .toc a {{
+    display: block;
+    padding: 6px 12px;
+    background: #f2f2f2;
+    border-radius: 20px;
+    text-decoration: none;
+    color: #0066cc;
+    transition: background 0.2s;
+  }}
+  .toc a:hover {{ background: #ddeeff; }}
+  table {{ table-layout: fixed; width:100%; border-collapse: collapse; margin-bottom:40px; }}
+  th, td {{ padding:6px; border:1px solid #ddd; word-wrap: break-word; }}
+  th {{ background:#e6e6e6; font-size:14px; text-align:left; }}
+  td {{ font-size:12px; text-align:left; white-space: pre-wrap; }}
+  .en-conge {{ color:#a00; font-style: italic; margin: 6px 0 16px 0; }}
+  .prio-haute {{ background-color:#ffdddd; }}
+  .prio-basse {{ background-color:#ddffdd; }}
+  .etat-non-demarree {{ background-color:#ffffcc; }}
+  tr.dtrg-group th {{ font-size:15px; background:#dde6f0; }}
+</style>
+<script>
+$(document).ready(function() {{
+    // lignes du tableau : bloc JSON en fin de page (cellules déjà échappées)
+    // colonne 0 (masquée) = rang de l'ingénieur dans `suivi.noms`
+    var suivi = JSON.parse(document.getElementById('suivi-donnees').textContent);
+    var table = $('#suivi').DataTable({{
+        data:        suivi.lignes,
+        deferRender: true,                      // DOM créé uniquement pour les lignes affichées
+        createdRow:  function(row, data) {{ if (data[{col_classe}]) {{ $(row).addClass(data[{col_classe}]); }} }},
+        rowGroup:    {{
+          dataSrc:     0,
+          startRender: function(rows, rang) {{ return suivi.noms[rang] + ' (' + rows.count() + ')'; }}
+        }},
+        orderFixed:  [[0, 'asc']],              // les ingénieurs restent groupés, dans l'ordre voulu
+        paging:      true,
+        pageLength:  {page_length},
+        ordering:    true,
+        order:       {ordre},      // tri sur la colonne Priorité (si affichée)
+        columnDefs:  [
+          {{ targets: 0, visible: false, searchable: false,
+             render: function(d, type) {{ return type === 'display' ? suivi.noms[d] : d; }} }}{def_prio}
+        ],
+        fixedHeader: true,
+        scrollX:     true,
+        language:    {langue}
+    }});
+
+    // Sommaire : filtre le tableau sur l'ingénieur choisi ("Tous" retire le filtre).
+    // Comparaison sur le rang brut de la colonne 0 : les noms, échappés en HTML, ne servent qu'à l'affichage.
+    var rangFiltre = '';
+    $.fn.dataTable.ext.search.push(function(settings, searchData, index, rowData) {{
+      return rangFiltre === '' || rowData[0] === rangFiltre;
+    }});
+    $('.toc a[data-rang]').on('click', function(e) {{
+      e.preventDefault();
+      rangFiltre = $(this).data('rang');
+      table.draw();
+    }});
+}});
+</script>
+</head>
+<body>
+<h1>Suivi des actions – {today}</h1>
+
+<nav class="toc">
+  <ul>
+"""
+
+_GABARIT_CONVENTIONS = """  </ul>
+</nav>
+
+<p><strong>Conventions de lecture du tableau :</strong></p>
+<ul>
+  <li><strong>Actions “Machine”</strong> : Toute action de calcul machine dont les données sont prêtes doit être priorisée, car il s’agit de temps machine et non de temps humain.</li>
+</ul>
+"""
+
+
+@lru_cache(maxsize=4)
+def _lire_feuille(fichier_excel: str, mtime: float, nom_feuille: str, skiprows: int, colonnes_utiles: tuple) -> pd.DataFrame:
+    """
+    Lit la feuille Excel (colonnes utiles uniquement).
+    Le résultat est mis en cache : `mtime` fait partie de la clé, donc un classeur
+    modifié est relu. Le DataFrame retourné est partagé : ne pas le modifier en place.
+    """
+    lecture = dict(
+        sheet_name=nom_feuille,
+        skiprows=skiprows,
+        usecols=lambda c: c in colonnes_utiles,
+        dtype={"Prise en charge par": "string", "Etat": "category"},
+    )
+    return pd.read_excel(fichier_excel, engine=_MOTEUR_EXCEL, **lecture)
+
+
+def _ancre(nom: str) -> str:
+    """Identifiant d'ancre (déjà échappé pour un attribut HTML) associé à un ingénieur."""
+    return _ESPACES.sub("_", nom).translate(_HTML_TRANS)
+
+
+def _asset_valide(fichier: str, contenu: bytes) -> bool:
+    """
+    Contrôle sommaire d'un fichier de `_ASSETS` : la traduction doit être un objet JSON,
+    les JS/CSS ne doivent pas être une page HTML (proxy, portail captif…) servie à leur place.
+    """
+    if fichier.endswith(".json"):
+        try:
+            return isinstance(json.loads(contenu.decode("utf-8")), dict)
+        except ValueError:
+            return False
+    return not contenu.lstrip().startswith(b"<")
+
+
+def _preparer_assets(dossier: str):
+    """
+    Télécharge dans `dossier` les fichiers de `_ASSETS` absents ou invalides (une seule fois :
+    les fichiers valides déjà présents sont réutilisés tels quels).
+    Retourne la traduction DataTables à intégrer à la page, ou None si un fichier n'a pas pu
+    être obtenu (pas de réseau, délai dépassé, contenu inattendu).
+    """
+    try:
+        for fichier, url in _ASSETS.values():
+            chemin = os.path.join(dossier, fichier)
+            contenu = None
+            if os.path.exists(chemin):
+                with open(chemin, "rb") as f:
+                    contenu = f.read()
+            if contenu is None or not _asset_valide(fichier, contenu):
+                with urllib.request.urlopen(url, timeout=_DELAI_TELECHARGEMENT) as reponse:
+                    contenu = reponse.read()
+                if not _asset_valide(fichier, contenu):
+                    raise ValueError(f"Contenu inattendu pour {url}")
+                # dossier créé seulement après un téléchargement valide (pas de `_assets/` vide en cas d'échec) ;
+                # écriture dans un fichier temporaire : pas de fichier tronqué en cas d'échec
+                os.makedirs(dossier, exist_ok=True)
+                with open(chemin + ".part", "wb") as f:
+                    f.write(contenu)
+                os.replace(chemin + ".part", chemin)
+        with open(os.path.join(dossier, _ASSETS["langue"][0]), encoding="utf-8") as f:
+            langue = json.load(f)
+    except (OSError, ValueError, http.client.HTTPException):
+        # HTTPException : transfert tronqué (IncompleteRead), réponse mal formée… ne dérive pas d'OSError
+        return None
+    # ré-sérialisée avec "<" échappé : le texte intégré ne peut pas fermer le <script> de la page
+    return json.dumps(langue, ensure_ascii=False).replace("<", "\\u003c")
+
+
 def generate_suivi_html(
     fichier_excel: str,
     sortie_html: str = None,
@@ -17,10 +215,11 @@ def generate_suivi_html(
     nom_col_priorite_affiche: str = "Priorité",
     skiprows: int = 10,
     etats_conserves=None,
+    assets_locaux: bool = False,
 ) -> str:
     """
-    Génère un HTML unique listant les actions par ingénieur.
-    - `ingenieurs_en_conge`: liste d'ingénieurs à marquer "En congé" (section sans tableau).
+    Génère un HTML unique listant les actions, groupées par ingénieur dans un seul tableau.
+    - `ingenieurs_en_conge`: liste d'ingénieurs à marquer "En congé" (note, sans lignes dans le tableau).
     - `ordre_voulu`: ordre imposé d’ingénieurs avant d’ajouter les autres.
     - `trier_autres_alpha`: True => les "autres" sont ajoutés triés par ordre alphabétique.
     - `tri_priorite_ascendant`: True => 1->10 ; False => 10->1
@@ -28,6 +227,8 @@ def generate_suivi_html(
     - `nom_col_priorite_affiche`: nom de la colonne "Priorité" à afficher dans le tableau (si votre Excel varie).
     - `skiprows`: nombre de lignes ignorées au début de la feuille Excel.
     - `etats_conserves`: liste des états conservés dans la colonne "Etat".
+    - `assets_locaux`: True => jQuery/DataTables copiés une fois dans `_assets/` à côté du HTML (page utilisable hors ligne) ;
+      si le téléchargement échoue, la page utilise le CDN.
 
     Retourne le chemin du fichier HTML généré.
     """
@@ -56,154 +257,172 @@ def generate_suivi_html(
     # --- Lecture & préparation ---
     if etats_conserves is None:
         etats_conserves = ["En cours", "Non démarrée"]
-    df = pd.read_excel(fichier_excel, sheet_name=nom_feuille, skiprows=skiprows)
-    df = df[df["Etat"].isin(etats_conserves)].copy()
-    df = df.fillna("")
+    # on ne lit que les colonnes utilisées (les autres ne sont ni parsées ni typées)
+    colonnes_utiles = set(colonnes) | {"Prise en charge par", "Etat", nom_col_priorite_affiche}
+    df = _lire_feuille(
+        fichier_excel,
+        os.path.getmtime(fichier_excel),
+        nom_feuille,
+        skiprows,
+        tuple(sorted(colonnes_utiles, key=str)),
+    )
+    # "Etat" est lu en catégorie : on filtre sur les codes entiers plutôt que sur les chaînes
+    # (le filtre produit un nouveau DataFrame : la version en cache n'est jamais modifiée)
+    etat = df["Etat"].cat
+    codes_conserves = etat.categories.get_indexer(etats_conserves)
+    df = df[np.isin(etat.codes.to_numpy(), codes_conserves[codes_conserves >= 0])]
 
     # colonne de priorité (numérique) pour tri
-    # (on s'appuie sur la colonne d'affichage demandée)
+    # (on s'appuie sur la colonne d'affichage demandée, avant fillna pour garder son dtype numérique ;
+    # les colonnes sont ajoutées plus bas via un seul `assign`, sans copie préalable du DataFrame filtré)
     if nom_col_priorite_affiche not in df.columns:
         raise ValueError(f"La colonne '{nom_col_priorite_affiche}' est introuvable dans la feuille '{nom_feuille}'.")
-    df["__prio_num"] = pd.to_numeric(df[nom_col_priorite_affiche], errors="coerce").fillna(0).astype(int)
+    prio_brute = df[nom_col_priorite_affiche]
+    if prio_brute.dtype.kind in "iuf":
+        # cas courant : colonne déjà numérique dans Excel, pas de passage par to_numeric
+        prio_num = np.nan_to_num(prio_brute.to_numpy(), nan=0).astype(np.int32)
+    else:
+        prio_num = pd.to_numeric(prio_brute, errors="coerce").fillna(0).astype(np.int32)
 
     # liste des ingénieurs
-    present = list(df["Prise en charge par"].dropna().unique())
-    autres = [n for n in present if n not in ordre_voulu]
+    responsables = df["Prise en charge par"].fillna("")
+    present = responsables.unique().tolist()
+    deja_places = set(ordre_voulu)
+    autres = [n for n in present if n not in deja_places]
     if trier_autres_alpha:
         autres = sorted(autres)
-    ingenieurs = [n for n in ordre_voulu if n in present] + autres
+    presents = set(present)
+    ingenieurs = [n for n in dict.fromkeys(ordre_voulu) if n in presents] + autres
 
-    # --- HTML head ---
-    order_dir = 'asc' if tri_priorite_ascendant else 'desc'
-    html_output = f"""<!DOCTYPE html>
-<html lang="fr">
-<head>
-<meta charset="utf-8">
-<title>Suivi des actions – {today}</title>
-<link rel="stylesheet" href="https://cdn.datatables.net/1.13.4/css/jquery.dataTables.min.css"/>
-<script src="https://code.jquery.com/jquery-3.6.0.min.js"></script>
-<script src="https://cdn.datatables.net/1.13.4/js/jquery.dataTables.min.js"></script>
-<style>
-  body {{ font-family: Arial, sans-serif; margin:20px; }}
-  h1, h2 {{ font-family: Arial, sans-serif; }}
-  .toc ul {{
-    display: flex; flex-wrap: wrap; gap: 8px;
-    padding: 0; margin: 0 0 30px 0;
-  }}
-  .toc li {{ list-style: none; }}
-  .toc a {{
-    display: block;
-    padding: 6px 12px;
-    background: #f2f2f2;
-    border-radius: 20px;
-    text-decoration: none;
-    color: #0066cc;
-    transition: background 0.2s;
-  }}
-  .toc a:hover {{ background: #ddeeff; }}
-  table {{ table-layout: fixed; width:100%; border-collapse: collapse; margin-bottom:40px; }}
-  th, td {{ padding:6px; border:1px solid #ddd; word-wrap: break-word; }}
-  th {{ background:#e6e6e6; font-size:14px; text-align:left; }}
-  td {{ font-size:12px; text-align:left; white-space: pre-wrap; }}
-  .en-conge {{ color:#a00; font-style: italic; margin: 6px 0 16px 0; }}
-  .prio-haute {{ background-color:#ffdddd; }}
-  .prio-basse {{ background-color:#ddffdd; }}
-  .etat-non-demarree {{ background-color:#ffffcc; }}
-  summary {{ cursor: pointer; margin: 6px 0; }}
-</style>
-<script>
-$(document).ready(function() {{
-    $('table.display').each(function() {{
-      $(this).DataTable({{
-        paging:      true,
-        pageLength:  {page_length},
-        ordering:    true,
-        order:       [[3, '{order_dir}']],      // tri sur la colonne Priorité
-        columnDefs:  [{{ targets: 3, type: 'num' }}],
-        fixedHeader: true,
-        scrollX:     true,
-        language:    {{ url: 'https://cdn.datatables.net/plug-ins/1.13.4/i18n/fr-FR.json' }}
-      }});
-    }});
-}});
-</script>
-</head>
-<body>
-<h1>Suivi des actions – {today}</h1>
-
-<nav class="toc">
-  <ul>
-"""
+    # Colonnes affichées à compléter par "" : seules celles qui ont des valeurs manquantes
+    # (la priorité est affichée via `__prio_num`, les catégories comme "Etat" n'en ont plus après le filtre)
+    a_completer = [
+        col for col in dict.fromkeys(colonnes)
+        if col not in (nom_col_priorite_affiche, "Prise en charge par")
+        and not isinstance(df[col].dtype, pd.CategoricalDtype)
+        and df[col].hasnans
+    ]
 
-    # --- Sommaire
-    for nom in ingenieurs:
-        anchor = nom.replace(" ", "_")
-        html_output += f"    <li><a href='#{anchor}'>{nom}</a></li>\n"
+    # Un seul `assign` : priorité numérique, colonnes complétées et ingénieur en catégorie ordonnée
+    # (le tri restitue directement les ingénieurs dans l'ordre voulu)
+    df = df.assign(
+        __prio_num=prio_num,
+        **{col: df[col].fillna("") for col in a_completer},
+        **{"Prise en charge par": pd.Categorical(responsables, categories=ingenieurs, ordered=True)},
+    )
 
-    html_output += """  </ul>
-</nav>
+    # Tri Python (complémentaire au tri DataTables côté client), fait une seule fois sur
+    # (ingénieur, priorité) : les lignes arrivent groupées par ingénieur, dans l'ordre voulu.
+    df_trie = df.sort_values(
+        ["Prise en charge par", "__prio_num"],
+        ascending=[True, tri_priorite_ascendant],
+        kind="stable",
+    )
 
-<p><strong>Conventions de lecture du tableau :</strong></p>
-<ul>
-  <li><strong>Actions “Machine”</strong> : Toute action de calcul machine dont les données sont prêtes doit être priorisée, car il s’agit de temps machine et non de temps humain.</li>
-</ul>
-"""
+    # Ingénieurs en congé : une note, pas de lignes dans le tableau
+    conges = set(ingenieurs_en_conge)
+    en_conge = [n for n in ingenieurs if n in conges]
+    actions = df_trie[~df_trie["Prise en charge par"].isin(en_conge)]
 
+    order_dir = 'asc' if tri_priorite_ascendant else 'desc'
+    # indices DataTables : la colonne 0 (masquée) porte le rang de l'ingénieur
+    if nom_col_priorite_affiche in colonnes:
+        col_prio = colonnes.index(nom_col_priorite_affiche) + 1
+        ordre = f"[[{col_prio}, '{order_dir}']]"
+        def_prio = f",\n          {{ targets: {col_prio}, type: 'num' }}"
+    else:
+        # colonne Priorité non affichée : seul orderFixed (ingénieurs) ordonne le tableau
+        ordre, def_prio = "[]", ""
     ICON = {"Machine": "⚙️", "Humain": "👤", "Deux": "🤝"}
 
-    # --- Sections par ingénieur
-    for resp in ingenieurs:
-        # Section header
-        html_output += "<hr style='margin:40px 0; border:none; border-top:1px solid #ccc;'/>\n"
-        html_output += f"<h2 id='{resp.replace(' ','_')}'>Actions de {resp}</h2>\n"
-        html_output += f"<details>\n<summary>{resp}</summary>\n"
+    # Classes de ligne (calcul vectorisé sur tout le tableau)
+    prio = actions["__prio_num"]
+    classes = pd.Series(
+        np.select([prio <= 2, prio >= 8], ["prio-haute", "prio-basse"], ""),
+        index=actions.index,
+    )
+    classes = (classes + np.where(actions["Etat"] == "Non démarrée", " etat-non-demarree", "")).str.strip()
 
-        # Si l'ingénieur est en congé -> note et on passe à la suite
-        if resp in ingenieurs_en_conge:
-            html_output += "<p class='en-conge'>En congé — pas d'actions listées pour cette période.</p>\n"
+    # Cellules : une Series de chaînes échappées par colonne
+    cells = []
+    for col in colonnes:
+        if col == nom_col_priorite_affiche:
+            vals = prio.astype(str)
+        elif col == "Type (Machine/Humain/Deux)":
+            brut = actions[col].astype(object)
+            vals = brut.map(ICON).fillna("") + " " + brut.map(str)
         else:
-            grp = df[df["Prise en charge par"] == resp].copy()
-            if grp.empty:
-                html_output += "<p class='en-conge'>Aucune action à afficher.</p>\n"
-            else:
-                # Tri Python (complémentaire au tri DataTables côté client)
-                grp = grp.sort_values("__prio_num", ascending=tri_priorite_ascendant)
-
-                # Construction du tableau
-                html_output += "<table class='display'><thead><tr>\n"
-                for col in colonnes:
-                    html_output += f"  <th>{col}</th>\n"
-                html_output += "</tr></thead><tbody>\n"
-
-                for _, row in grp.iterrows():
-                    classes = []
-                    if row["__prio_num"] <= 2:
-                        classes.append("prio-haute")
-                    elif row["__prio_num"] >= 8:
-                        classes.append("prio-basse")
-                    if row["Etat"] == "Non démarrée":
-                        classes.append("etat-non-demarree")
-                    row_class = " ".join(classes)
-                    html_output += f"<tr class='{row_class}'>" if row_class else "<tr>"
-                    for col in colonnes:
-                        if col == nom_col_priorite_affiche:
-                            val = int(row["__prio_num"])
-                        elif col == "Type (Machine/Humain/Deux)":
-                            val = f"{ICON.get(row[col],'')} {row[col]}"
-                        else:
-                            val = row[col]
-                        val = html.escape(str(val))
-                        html_output += f"<td>{val}</td>"
-                    html_output += "</tr>\n"
-
-                html_output += "</tbody></table>\n"
-        html_output += "</details>\n"
-
-    html_output += "</body>\n</html>"
-
-    # --- Écriture du fichier
-    with open(sortie_html, "w", encoding="utf-8") as f:
-        f.write(html_output)
+            vals = actions[col].astype(object).map(str)
+        cells.append(vals.str.translate(_HTML_TRANS))
+
+    # chaque ligne = rang de l'ingénieur + cellules + classe CSS de la ligne
+    donnees = {
+        "noms": [nom.translate(_HTML_TRANS) for nom in ingenieurs],
+        "lignes": list(zip(actions["Prise en charge par"].cat.codes.tolist(), *cells, classes)),
+    }
+
+    # --- Fichiers jQuery / DataTables : copie locale dans `_assets/` si demandée et disponible, sinon CDN
+    langue_locale = None
+    if assets_locaux:
+        dossier_assets = os.path.join(os.path.dirname(sortie_html) or ".", "_assets")
+        langue_locale = _preparer_assets(dossier_assets)
+        if langue_locale is None:
+            warnings.warn(f"Fichiers jQuery/DataTables indisponibles dans '{dossier_assets}' : utilisation du CDN.")
+    if langue_locale is not None:
+        sources = {cle: f"_assets/{fichier}" for cle, (fichier, _) in _ASSETS.items()}
+        # traduction intégrée à la page : language.url ferait une requête XHR, bloquée en file://
+        sources["langue"] = langue_locale
+    else:
+        sources = {cle: url for cle, (_, url) in _ASSETS.items()}
+        sources["langue"] = f"{{ url: '{sources['langue']}' }}"
+
+    parts = []
+
+    # --- HTML head ---
+    parts.append(_GABARIT_ENTETE.format(
+        **sources,
+        today=today,
+        page_length=page_length,
+        ordre=ordre,
+        def_prio=def_prio,
+        col_classe=len(colonnes) + 1,
+    ))
+
+    # --- Sommaire : filtre par ingénieur, ou lien vers la note pour les absents
+    noms_html = donnees["noms"]
+    parts.append("    <li><a href='#' data-rang=''>Tous</a></li>\n")
+    parts.append("".join(
+        f"    <li><a href='#{_ancre(nom)}'>{noms_html[rang]}</a></li>\n" if nom in conges
+        else f"    <li><a href='#{_ancre(nom)}' data-rang='{rang}'>{noms_html[rang]}</a></li>\n"
+        for rang, nom in enumerate(ingenieurs)
+    ))
+
+    parts.append(_GABARIT_CONVENTIONS)
+
+    # --- Notes d'absence
+    for nom in en_conge:
+        parts.append(
+            f"<p class='en-conge' id='{_ancre(nom)}'><strong>{nom.translate(_HTML_TRANS)}</strong> : "
+            "En congé — pas d'actions listées pour cette période.</p>\n"
+        )
+
+    # --- Tableau unique (en-tête seul, les lignes sont fournies par le bloc JSON)
+    parts.append(
+        "<table id='suivi' class='display'><thead><tr>\n"
+        "  <th>Ingénieur</th>\n"
+        + "".join("  <th>" + str(col).translate(_HTML_TRANS) + "</th>\n" for col in colonnes)
+        + "</tr></thead></table>\n"
+    )
+
+    # Données du tableau : "<" est toujours échappé, le bloc ne peut pas fermer le <script>
+    parts.append("<script type='application/json' id='suivi-donnees'>")
+    parts.append(json.dumps(donnees, ensure_ascii=False))
+    parts.append("</script>\n")
+
+    parts.append("</body>\n</html>")
+
+    # --- Écriture du fichier : un seul encodage UTF-8 et une seule écriture binaire
+    Path(sortie_html).write_bytes("".join(parts).encode("utf-8"))
 
     return sortie_html
 